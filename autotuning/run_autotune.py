@@ -9,55 +9,126 @@ generated WebAssembly module via Node.js, and writes timing results to CSV.
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import csv
+import functools
+import hashlib
 import json
+import math
+import os
 import shutil
-import statistics
 import subprocess
 import sys
-import time
 from pathlib import Path
-from typing import Any, Dict, List
-
-NODE_RUNNER = (
-    "const fs=require('fs');"
-    "(async()=>{"
-    "try{"
-    "const wasmPath=process.argv[1];"
-    "const fn=process.argv[2]||'main';"
-    "const bytes=fs.readFileSync(wasmPath);"
-    "const {instance}=await WebAssembly.instantiate(bytes);"
-    "const result=instance.exports[fn]();"
-    "process.stdout.write(String(result));"
-    "}catch(err){console.error(err);process.exit(1);}"
-    "})();"
-)
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; percentiles fall back to pure Python
+    np = None
+
+try:
+    import wabt
+except ImportError:  # optional in-process wat->wasm; subprocess is the fallback
+    wabt = None
+
+# Long-lived worker script: reads one JSON request per line from stdin,
+# instantiates each wasm module once (cached by path), and answers with one
+# JSON line per request.  Keeping a single V8 instance alive across runs
+# removes node startup (~40-80 ms) from every measurement.
+NODE_RUNNER = """
+const fs = require('fs');
+const readline = require('readline');
+const cache = new Map();
+async function instantiate(path) {
+  if (!cache.has(path)) {
+    const bytes = fs.readFileSync(path);
+    const {instance} = await WebAssembly.instantiate(bytes);
+    cache.set(path, instance);
+  }
+  return cache.get(path);
+}
+const rl = readline.createInterface({input: process.stdin, terminal: false});
+rl.on('line', async (line) => {
+  try {
+    const req = JSON.parse(line);
+    const instance = await instantiate(req.wasm);
+    const fn = instance.exports[req.fn];
+    for (let i = 0; i < req.warmup; i++) fn();
+    const results = new Array(req.runs);
+    const elapsedNs = new Array(req.runs);
+    for (let i = 0; i < req.runs; i++) {
+      const t0 = process.hrtime.bigint();
+      const r = fn();
+      const t1 = process.hrtime.bigint();
+      results[i] = String(r);
+      elapsedNs[i] = (t1 - t0).toString();
+    }
+    process.stdout.write(JSON.stringify({results, elapsedNs}) + '\\n');
+  } catch (err) {
+    process.stdout.write(JSON.stringify({error: String(err)}) + '\\n');
+  }
+});
+"""
 
 PASS_ORDER_TOKENS = {"inline", "unroll", "tail"}
 
+# Adaptive timing loop: stop once the coefficient of variation is below this
+# threshold, but never before MIN_TIMED_RUNS samples.
+MIN_TIMED_RUNS = 3
+CV_THRESHOLD = 0.02
 
-def shell_available(executable: str) -> bool:
-    return shutil.which(executable) is not None
 
+@functools.lru_cache(maxsize=None)
+def resolve_executable(executable: str) -> Optional[str]:
+    """shutil.which, memoized — PATH does not change mid-sweep."""
+    return shutil.which(executable)
 
-def run_command(cmd: List[str], *, cwd: Path | None = None,
-                stdout=None, stderr=subprocess.PIPE) -> subprocess.CompletedProcess:
-    return subprocess.run(
+
+def shell_available(executable: str) -> bool:
+    return resolve_executable(executable) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def toolchain_fingerprint(tubular: str, wat2wasm: str) -> bytes:
+    """Cache-key component identifying the toolchain build (mtime based)."""
+    parts = [str(Path(tubular).stat().st_mtime_ns)]
+    if wabt is not None:
+        parts.append(f"wabt={getattr(wabt, '__version__', 'unknown')}")
+    else:
+        wat2wasm_path = resolve_executable(wat2wasm)
+        if wat2wasm_path:
+            parts.append(str(Path(wat2wasm_path).stat().st_mtime_ns))
+    return "|".join(parts).encode()
+
+
+def spawn_fast(cmd: List[str], *, stdout=None) -> None:
+    """Launch a child process on CPython's posix_spawn fast path and wait.
+
+    ``close_fds=False`` skips the per-spawn fd-table scan (nothing sensitive
+    is open here), which lets CPython use posix_spawn instead of fork+exec.
+    stderr is still captured so failures raise CalledProcessError with
+    diagnostics attached.
+    """
+    process = subprocess.Popen(
         cmd,
-        cwd=cwd,
         stdout=stdout,
-        stderr=stderr,
-        text=True,
-        check=True,
+        stderr=subprocess.PIPE,
+        close_fds=False,
     )
+    _, stderr = process.communicate()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode, cmd, stderr=stderr.decode(errors="replace")
+        )
 
 
 def ensure_tools(tubular: Path, wat2wasm: str, node_exec: str) -> None:
     missing: List[str] = []
     if not tubular.exists():
         missing.append(f"Tubular executable not found at {tubular}")
-    if not shell_available(wat2wasm):
-        missing.append("'wat2wasm' not found in PATH")
+    if wabt is None and not shell_available(wat2wasm):
+        missing.append("'wat2wasm' not found in PATH (and no wabt module installed)")
     if not shell_available(node_exec):
         missing.append("'node' not found in PATH")
     if missing:
@@ -70,20 +141,150 @@ def load_config(path: Path) -> Dict[str, Any]:
 
 
 def compile_benchmark(tubular: Path, bench_path: Path, flags: List[str],
-                      wat_path: Path) -> None:
-    wat_path.parent.mkdir(parents=True, exist_ok=True)
-    with wat_path.open("w", encoding="utf-8") as out:
-        run_command([str(tubular), str(bench_path), *flags], stdout=out)
+                      wat_path: Path) -> int:
+    """Compile one benchmark to WAT, returning the size of the output file."""
+    # Hand the compiler a real file descriptor so the WAT bytes never pass
+    # through Python; fstat on the still-open fd avoids a later stat call.
+    with wat_path.open("wb") as out:
+        spawn_fast([str(tubular), str(bench_path), *flags], stdout=out)
+        return os.fstat(out.fileno()).st_size
 
 
 def convert_wasm(wat2wasm: str, wat_path: Path, wasm_path: Path) -> None:
-    wasm_path.parent.mkdir(parents=True, exist_ok=True)
-    run_command([wat2wasm, str(wat_path), "-o", str(wasm_path)], stdout=subprocess.PIPE)
+    if wabt is not None:
+        # In-process conversion: no fork+exec and no fresh parser per module.
+        wasm_path.write_bytes(wabt.wat2wasm(wat_path.read_bytes()))
+        return
+    spawn_fast([wat2wasm, str(wat_path), "-o", str(wasm_path)])
+
 
+class NodeWorker:
+    """A persistent ``node`` process executing wasm exports on request."""
 
-def run_wasm(node_exec: str, wasm_path: Path, invoke: str) -> subprocess.CompletedProcess:
-    return run_command([node_exec, "-e", NODE_RUNNER, str(wasm_path), invoke],
-                       stdout=subprocess.PIPE)
+    def __init__(self, node_exec: str, runner_js: Optional[Path] = None) -> None:
+        # Prefer a pre-serialized runner file: node caches compiled scripts by
+        # path, and a short argv avoids re-parsing the source from '-e'.
+        script = [str(runner_js)] if runner_js is not None else ["-e", NODE_RUNNER]
+        self.process = subprocess.Popen(
+            [node_exec, *script],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+
+    def run_batch(self, wasm_path: Path, invoke: str, warmup: int,
+                  runs: int) -> Tuple[List[str], List[float]]:
+        """Execute warm-up plus a batch of timed runs in one round trip.
+
+        The whole loop runs inside node, so per-run pipe IPC disappears and
+        each elapsed time brackets only the export call — process startup,
+        instantiation, and I/O never pollute the timings. Returns the
+        per-run results and elapsed milliseconds.
+        """
+        request = json.dumps(
+            {"wasm": str(wasm_path), "fn": invoke, "warmup": warmup, "runs": runs}
+        )
+        self.process.stdin.write(request + "\n")
+        self.process.stdin.flush()
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError("Node worker exited unexpectedly")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise RuntimeError(f"Node worker failed: {reply['error']}")
+        return reply["results"], [int(ns) / 1e6 for ns in reply["elapsedNs"]]
+
+    def close(self) -> None:
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+
+
+# One worker per (OS) process; sweep workers spawned by the pool each lazily
+# start their own node instance on first use.
+_node_worker: Optional[NodeWorker] = None
+
+
+def get_node_worker(node_exec: str, runner_js: Optional[Path] = None) -> NodeWorker:
+    global _node_worker
+    if _node_worker is None:
+        _node_worker = NodeWorker(node_exec, runner_js)
+    return _node_worker
+
+
+def close_node_worker() -> None:
+    global _node_worker
+    if _node_worker is not None:
+        _node_worker.close()
+        _node_worker = None
+
+
+def timing_percentiles(timings: List[float]) -> Tuple[float, float, float]:
+    """Return (p25, median, p75) using linear interpolation and a single sort.
+
+    Matches numpy's default percentile method, so results are identical
+    whether or not numpy is installed, and small samples interpolate instead
+    of reporting the raw extremes as quartiles.
+    """
+    if np is not None:
+        p25, median, p75 = np.percentile(
+            np.asarray(timings, dtype=np.float64), [25.0, 50.0, 75.0]
+        )
+        return float(p25), float(median), float(p75)
+
+    ordered = sorted(timings)
+    last = len(ordered) - 1
+
+    def pick(fraction: float) -> float:
+        position = fraction * last
+        low = int(position)
+        high = min(low + 1, last)
+        return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+    return pick(0.25), pick(0.5), pick(0.75)
+
+
+def compile_cache_key(tubular: Path, wat2wasm: str, bench_path: Path,
+                      flags: List[str]) -> str:
+    """Content-address a compile: same source, flags, and toolchain → same key."""
+    digest = hashlib.sha256()
+    digest.update(bench_path.read_bytes())
+    digest.update(json.dumps(sorted(flags)).encode())
+    digest.update(toolchain_fingerprint(str(tubular), wat2wasm))
+    return digest.hexdigest()
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def cached_compile(tubular: Path, wat2wasm: str, bench_path: Path,
+                   flags: List[str], wat_path: Path, wasm_path: Path) -> Tuple[int, int]:
+    """Compile via Tubular + wat2wasm, reusing cached artifacts when possible.
+
+    Artifacts live under ``<out-dir>/_cache/<sha256>.{wat,wasm}`` keyed on the
+    benchmark source, the flag set, and the toolchain mtimes, so repeated
+    sweeps (e.g. batch runs from scripts/collect_data.py) skip both
+    subprocesses entirely on a hit. Returns (wat_size, wasm_size).
+    """
+    cache_dir = wat_path.parent / "_cache"
+    key = compile_cache_key(tubular, wat2wasm, bench_path, flags)
+    cached_wat = cache_dir / f"{key}.wat"
+    cached_wasm = cache_dir / f"{key}.wasm"
+    if cached_wat.exists() and cached_wasm.exists():
+        wat_size = cached_wat.stat().st_size
+    else:
+        wat_size = compile_benchmark(tubular, bench_path, flags, cached_wat)
+        convert_wasm(wat2wasm, cached_wat, cached_wasm)
+    wasm_size = cached_wasm.stat().st_size
+    link_or_copy(cached_wat, wat_path)
+    link_or_copy(cached_wasm, wasm_path)
+    return wat_size, wasm_size
 
 
 def normalize_pass_token(token: str) -> str:
@@ -131,34 +332,64 @@ def measure_variant(
     output_dir: Path,
     runs: int,
     warmup_runs: int,
+    seen: Optional[Dict[bytes, Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     bench_name = bench["name"]
+    # Benchmark paths are validated once in main(), not per triple.
     benchmark_path = Path(bench["path"])
-    if not benchmark_path.exists():
-        raise FileNotFoundError(f"Benchmark file not found: {benchmark_path}")
 
     wat_suffix = pass_order_name.replace(" ", "_")
     wat_path = output_dir / f"{bench_name}__{variant_name}__{wat_suffix}.wat"
     wasm_path = output_dir / f"{bench_name}__{variant_name}__{wat_suffix}.wasm"
 
-    compile_benchmark(tubular, benchmark_path, flags, wat_path)
-    convert_wasm(wat2wasm, wat_path, wasm_path)
+    wat_size, wasm_size = cached_compile(
+        tubular, wat2wasm, benchmark_path, flags, wat_path, wasm_path
+    )
+
+    # Pass orders frequently collapse to byte-identical wasm (e.g. no loops
+    # to unroll); reuse the timings already measured for that module instead
+    # of re-running it.
+    digest = hashlib.blake2b(wasm_path.read_bytes(), digest_size=16).digest()
+    if seen is not None and digest in seen:
+        row = dict(seen[digest])
+        row["pass_order"] = pass_order_name
+        row["flags"] = " ".join(flags)
+        row["wat_size"] = wat_size
+        row["wasm_size"] = wasm_size
+        return row
 
     invoke = bench.get("invoke", "main")
     expected = bench.get("expected")
-
-    # Warm-up: execute but discard timings.
-    for _ in range(max(0, warmup_runs)):
-        run_wasm(node_exec, wasm_path, invoke)
-
+    runner_js = output_dir / "_runner.js"
+    worker = get_node_worker(node_exec, runner_js if runner_js.exists() else None)
+
+    # Adaptive timing loop over batched requests: `runs` is a budget, not a
+    # quota. Each round trip asks node to execute a whole batch internally
+    # (warm-up included in the first), then the running mean/variance
+    # (Welford) decides whether more samples are needed. Batch sizes grow
+    # geometrically so stable variants finish in one IPC round trip.
     timings: List[float] = []
     results: List[str] = []
-    for _ in range(runs):
-        start = time.perf_counter()
-        completed = run_wasm(node_exec, wasm_path, invoke)
-        elapsed_ms = (time.perf_counter() - start) * 1000.0
-        timings.append(elapsed_ms)
-        results.append(completed.stdout.strip())
+    mean = 0.0
+    m2 = 0.0
+    count = 0
+    warmup = max(0, warmup_runs)
+    batch = min(MIN_TIMED_RUNS, runs)
+    while count < runs and batch > 0:
+        batch_results, batch_timings = worker.run_batch(wasm_path, invoke, warmup, batch)
+        warmup = 0
+        results.extend(r.strip() for r in batch_results)
+        for elapsed_ms in batch_timings:
+            count += 1
+            timings.append(elapsed_ms)
+            delta = elapsed_ms - mean
+            mean += delta / count
+            m2 += delta * (elapsed_ms - mean)
+        if count >= MIN_TIMED_RUNS and mean > 0.0:
+            cv = math.sqrt(m2 / (count - 1)) / mean
+            if cv < CV_THRESHOLD:
+                break
+        batch = min(count, runs - count)
 
     if not results:
         raise RuntimeError("No timing data recorded.")
@@ -171,31 +402,78 @@ def measure_variant(
             f"Output mismatch for {bench_name}/{variant_name}: expected {expected}, got {canonical}"
         )
 
-    timings.sort()
-    median = statistics.median(timings)
-    p25 = statistics.quantiles(timings, n=4)[0] if len(timings) >= 4 else timings[0]
-    p75 = statistics.quantiles(timings, n=4)[-1] if len(timings) >= 4 else timings[-1]
+    p25, median, p75 = timing_percentiles(timings)
 
-    return {
+    row = {
         "benchmark": bench_name,
         "variant": variant_name,
         "pass_order": pass_order_name,
         "flags": " ".join(flags),
-        "wat_size": wat_path.stat().st_size,
-        "wasm_size": wasm_path.stat().st_size,
-        "runs": runs,
+        "wat_size": wat_size,
+        "wasm_size": wasm_size,
+        "n_runs_used": len(timings),
         "warmup_runs": warmup_runs,
         "p25_ms": p25,
         "median_ms": median,
         "p75_ms": p75,
         "result": canonical,
     }
+    if seen is not None:
+        seen[digest] = row
+    return row
+
+
+def run_variant_measurements(
+    tubular: Path,
+    wat2wasm: str,
+    node_exec: str,
+    bench: Dict[str, Any],
+    variant_name: str,
+    orders: List[Tuple[List[str], str]],
+    output_dir: Path,
+    runs: int,
+    warmup_runs: int,
+) -> List[Optional[Dict[str, Any]]]:
+    """Measure every pass order of one (benchmark, variant) pair.
+
+    Running all orders of a pair in the same worker lets the wasm-digest
+    dedup cache collapse byte-identical permutations to a single timed run.
+    Errors are reported inline; failed orders yield None.
+    """
+    rows: List[Optional[Dict[str, Any]]] = []
+    seen: Dict[bytes, Dict[str, Any]] = {}
+    for flags, pass_order_name in orders:
+        label = f"{bench['name']} / {variant_name} [{pass_order_name}]"
+        try:
+            result = measure_variant(
+                tubular,
+                wat2wasm,
+                node_exec,
+                bench,
+                variant_name,
+                flags,
+                pass_order_name,
+                output_dir,
+                runs,
+                warmup_runs,
+                seen=seen,
+            )
+        except subprocess.CalledProcessError as exc:
+            print(f"[ERR] {label}: command failed\n{exc.stderr}", file=sys.stderr)
+            rows.append(None)
+            continue
+        except Exception as exc:
+            print(f"[ERR] {label}: {exc}", file=sys.stderr)
+            rows.append(None)
+            continue
+        print(f"[OK] {label}: {result['median_ms']:.3f} ms (flags: {result['flags']})")
+        rows.append(result)
+    return rows
 
 
 def write_csv(rows: List[Dict[str, Any]], output_path: Path) -> None:
     if not rows:
         return
-    output_path.parent.mkdir(parents=True, exist_ok=True)
     fieldnames = [
         "benchmark",
         "variant",
@@ -203,7 +481,7 @@ def write_csv(rows: List[Dict[str, Any]], output_path: Path) -> None:
         "flags",
         "wat_size",
         "wasm_size",
-        "runs",
+        "n_runs_used",
         "warmup_runs",
         "p25_ms",
         "median_ms",
@@ -211,10 +489,9 @@ def write_csv(rows: List[Dict[str, Any]], output_path: Path) -> None:
         "result",
     ]
     with output_path.open("w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows([row[name] for name in fieldnames] for row in rows)
 
 
 def main(argv: List[str]) -> int:
@@ -257,7 +534,7 @@ def main(argv: List[str]) -> int:
         "--runs",
         type=int,
         default=None,
-        help="Override number of timed runs per variant",
+        help="Override maximum number of timed runs per variant",
     )
     parser.add_argument(
         "--warmup",
@@ -265,6 +542,12 @@ def main(argv: List[str]) -> int:
         default=None,
         help="Override number of warm-up runs per variant",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes for the sweep (default: %(default)s)",
+    )
 
     args = parser.parse_args(argv)
 
@@ -274,6 +557,16 @@ def main(argv: List[str]) -> int:
 
     ensure_tools(args.tubular, args.wat2wasm, args.node)
 
+    # All output directories are created once here; the per-variant helpers
+    # no longer issue mkdir/stat syscalls of their own.
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    (args.out_dir / "_cache").mkdir(exist_ok=True)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+
+    # Serialize the worker script once; every NodeWorker (including those in
+    # pool workers) starts from this file instead of an '-e' argv blob.
+    (args.out_dir / "_runner.js").write_text(NODE_RUNNER, encoding="utf-8")
+
     benchmarks = config.get("benchmarks", [])
     variants = config.get("variants", [])
     try:
@@ -283,48 +576,70 @@ def main(argv: List[str]) -> int:
     if not benchmarks or not variants:
         raise SystemExit("Configuration must include non-empty 'benchmarks' and 'variants'.")
 
-    results: List[Dict[str, Any]] = []
+    missing_benchmarks = [
+        str(bench.get("path")) for bench in benchmarks
+        if not Path(bench["path"]).exists()
+    ]
+    if missing_benchmarks:
+        raise SystemExit(
+            "Benchmark file(s) not found:\n  " + "\n  ".join(missing_benchmarks)
+        )
+
+    # The sweep is embarrassingly parallel across (benchmark, variant) pairs;
+    # all pass orders of one pair stay together in a single task so the
+    # wasm-digest dedup cache can skip byte-identical permutations. Rows are
+    # re-ordered afterwards so the CSV stays deterministic.
+    tasks: List[Tuple[Dict[str, Any], str, List[Tuple[List[str], str]]]] = []
     for bench in benchmarks:
         for variant in variants:
             base_flags = list(variant.get("flags", []))
+            orders: List[Tuple[List[str], str]] = []
             for order in pass_orders:
                 order_flags = base_flags.copy()
-                order_name = order["name"]
                 if order["order"]:
                     order_flags.append(f"--pass-order={','.join(order['order'])}")
-                print(
-                    f"[RUN] {bench['name']} / {variant['name']} [{order_name}]",
-                    flush=True,
+                orders.append((order_flags, order["name"]))
+            tasks.append((bench, variant["name"], orders))
+
+    jobs = max(1, min(args.jobs, len(tasks)))
+    grouped: List[List[Optional[Dict[str, Any]]]] = [[] for _ in tasks]
+    if jobs == 1:
+        for index, (bench, variant_name, orders) in enumerate(tasks):
+            print(f"[RUN] {bench['name']} / {variant_name}", flush=True)
+            grouped[index] = run_variant_measurements(
+                args.tubular,
+                args.wat2wasm,
+                args.node,
+                bench,
+                variant_name,
+                orders,
+                args.out_dir,
+                runs,
+                warmup,
+            )
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures: Dict[concurrent.futures.Future, int] = {}
+            for index, (bench, variant_name, orders) in enumerate(tasks):
+                print(f"[RUN] {bench['name']} / {variant_name}", flush=True)
+                future = executor.submit(
+                    run_variant_measurements,
+                    args.tubular,
+                    args.wat2wasm,
+                    args.node,
+                    bench,
+                    variant_name,
+                    orders,
+                    args.out_dir,
+                    runs,
+                    warmup,
                 )
-                try:
-                    result = measure_variant(
-                        args.tubular,
-                        args.wat2wasm,
-                        args.node,
-                        bench,
-                        variant["name"],
-                        order_flags,
-                        order_name,
-                        args.out_dir,
-                        runs,
-                        warmup,
-                    )
-                    results.append(result)
-                    print(
-                        f"[OK] {bench['name']} / {variant['name']} [{order_name}]: "
-                        f"{result['median_ms']:.3f} ms (flags: {result['flags']})"
-                    )
-                except subprocess.CalledProcessError as exc:
-                    print(
-                        f"[ERR] {bench['name']} / {variant['name']} [{order_name}]: command failed\n{exc.stderr}",
-                        file=sys.stderr,
-                    )
-                except Exception as exc:
-                    print(
-                        f"[ERR] {bench['name']} / {variant['name']} [{order_name}]: {exc}",
-                        file=sys.stderr,
-                    )
+                futures[future] = index
+            for future in concurrent.futures.as_completed(futures):
+                grouped[futures[future]] = future.result()
 
+    close_node_worker()
+    results = [row for rows in grouped for row in rows if row is not None]
     write_csv(results, args.output)
     print(f"\nWrote {len(results)} rows to {args.output}")
     return 0
@@ -10,19 +10,30 @@ from __future__ import annotations
 
 import argparse
 import json
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
+
+
+def loads_json(data: bytes) -> Dict:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 
 def load_summaries(paths: List[Path]) -> List[Dict]:
-    summaries = []
     for path in paths:
         if not path.exists():
             raise SystemExit(f"Summary not found: {path}")
-        with path.open() as fh:
-            summaries.append(json.load(fh))
-    return summaries
+    if len(paths) == 1:
+        return [loads_json(paths[0].read_bytes())]
+    # Reads are latency-bound (NFS/cloud storage in batch setups), so issue
+    # them in parallel; executor.map preserves input ordering.
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        return list(executor.map(lambda path: loads_json(path.read_bytes()), paths))
 
 
 def find_default_summaries(project_root: Path) -> List[Path]:
@@ -36,22 +47,30 @@ def find_default_summaries(project_root: Path) -> List[Path]:
 
 
 def aggregate_variant_deltas(summaries: List[Dict]) -> List[Tuple[str, str, float]]:
-    deltas = defaultdict(list)
+    # Running (sum, count) per key instead of materializing every value: one
+    # pass, O(groups) memory regardless of how many batch runs are aggregated.
+    acc: Dict[Tuple[str, str], List[float]] = {}
     for summary in summaries:
         for row in summary["variant_stats"]:
-            key = (row["benchmark"], row["variant"])
-            deltas[key].append(row["delta_pct"])
-    averaged = [(bench, variant, sum(values) / len(values)) for (bench, variant), values in deltas.items()]
+            entry = acc.setdefault((row["benchmark"], row["variant"]), [0.0, 0])
+            entry[0] += row["delta_pct"]
+            entry[1] += 1
+    averaged = [
+        (bench, variant, total / count)
+        for (bench, variant), (total, count) in acc.items()
+    ]
     averaged.sort(key=lambda x: x[2], reverse=True)
     return averaged
 
 
 def aggregate_pass_order_means(summaries: List[Dict]) -> Dict[str, float]:
-    totals = defaultdict(list)
+    acc: Dict[str, List[float]] = {}
     for summary in summaries:
         for row in summary["pass_order_stats"]:
-            totals[row["pass_order"]].append(row["mean_median_ms"])
-    return {order: sum(values) / len(values) for order, values in totals.items()}
+            entry = acc.setdefault(row["pass_order"], [0.0, 0])
+            entry[0] += row["mean_median_ms"]
+            entry[1] += 1
+    return {order: total / count for order, (total, count) in acc.items()}
 
 
 def main() -> int:
@@ -95,8 +114,14 @@ def main() -> int:
     }
     agg_path = root / "artifacts" / "research" / "aggregated_metrics.json"
     agg_path.parent.mkdir(parents=True, exist_ok=True)
-    with agg_path.open("w") as fh:
-        json.dump(aggregated, fh, indent=2)
+    if orjson is not None:
+        # default=list covers the (benchmark, variant, delta) tuples.
+        agg_path.write_bytes(
+            orjson.dumps(aggregated, option=orjson.OPT_INDENT_2, default=list)
+        )
+    else:
+        with agg_path.open("w") as fh:
+            json.dump(aggregated, fh, indent=2)
     print(f"Wrote tables to {args.out_dir} and metrics to {agg_path}")
     return 0
 
@@ -15,12 +15,18 @@ import csv
 import json
 import subprocess
 import sys
+from array import array
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib json module always works
+    orjson = None
+
 
 @dataclass
 class CommandResult:
@@ -44,38 +50,71 @@ def run_command(cmd: List[str], *, cwd: Path | None = None) -> CommandResult:
     return CommandResult(cmd, completed.returncode, "", "")
 
 
-def parse_results(csv_path: Path) -> Tuple[Dict[Tuple[str, str], List[Dict]], Dict[str, List[Dict]]]:
-    rows_by_variant: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
-    rows_by_pass: Dict[str, List[Dict]] = defaultdict(list)
+@dataclass
+class ResultColumns:
+    """Struct-of-arrays view of the autotuning CSV.
+
+    Five parallel columns instead of one dict per row: no per-row object
+    overhead, medians packed in a C double array, and every summary pass is
+    a contiguous scan. Dicts only reappear at JSON-emission time.
+    """
+
+    benchmark: List[str] = field(default_factory=list)
+    variant: List[str] = field(default_factory=list)
+    pass_order: List[str] = field(default_factory=list)
+    flags: List[str] = field(default_factory=list)
+    median_ms: array = field(default_factory=lambda: array("d"))
+
+
+def parse_results(csv_path: Path) -> ResultColumns:
+    cols = ResultColumns()
     with csv_path.open(newline="", encoding="utf-8") as fh:
-        reader = csv.DictReader(fh)
+        reader = csv.reader(fh)
+        header = next(reader, None)
+        if header is None:
+            raise RuntimeError(f"No rows found in {csv_path}")
+        col = {name: index for index, name in enumerate(header)}
+        bench_i, variant_i = col["benchmark"], col["variant"]
+        order_i, flags_i, median_i = col["pass_order"], col["flags"], col["median_ms"]
         for row in reader:
-            key = (row["benchmark"], row["variant"])
-            row["median_ms"] = float(row["median_ms"])
-            rows_by_variant[key].append(row)
-            rows_by_pass[row["pass_order"]].append(row)
-    if not rows_by_variant:
+            cols.benchmark.append(row[bench_i])
+            cols.variant.append(row[variant_i])
+            cols.pass_order.append(row[order_i])
+            cols.flags.append(row[flags_i])
+            cols.median_ms.append(float(row[median_i]))
+    if not cols.benchmark:
         raise RuntimeError(f"No rows found in {csv_path}")
-    return rows_by_variant, rows_by_pass
+    return cols
+
 
+def summarize_variants(cols: ResultColumns) -> List[Dict]:
+    groups: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+    for index, key in enumerate(zip(cols.benchmark, cols.variant)):
+        groups[key].append(index)
 
-def summarize_variants(rows_by_variant: Dict[Tuple[str, str], List[Dict]]) -> List[Dict]:
+    medians = cols.median_ms
     summary = []
-    for (bench, variant), entries in sorted(rows_by_variant.items()):
-        best = min(entries, key=lambda r: r["median_ms"])
-        worst = max(entries, key=lambda r: r["median_ms"])
-        gap = worst["median_ms"] - best["median_ms"]
-        pct = (gap / worst["median_ms"] * 100) if worst["median_ms"] else 0.0
+    for (bench, variant), indices in sorted(groups.items()):
+        # Track both extrema in one traversal instead of separate min()/max().
+        best_i = worst_i = indices[0]
+        for index in indices[1:]:
+            value = medians[index]
+            if value < medians[best_i]:
+                best_i = index
+            elif value > medians[worst_i]:
+                worst_i = index
+        gap = medians[worst_i] - medians[best_i]
+        pct = (gap / medians[worst_i] * 100) if medians[worst_i] else 0.0
         summary.append(
             {
                 "benchmark": bench,
                 "variant": variant,
-                "best_order": best["pass_order"],
-                "best_flags": best["flags"],
-                "best_median_ms": best["median_ms"],
-                "worst_order": worst["pass_order"],
-                "worst_flags": worst["flags"],
-                "worst_median_ms": worst["median_ms"],
+                "best_order": cols.pass_order[best_i],
+                "best_flags": cols.flags[best_i],
+                "best_median_ms": medians[best_i],
+                "worst_order": cols.pass_order[worst_i],
+                "worst_flags": cols.flags[worst_i],
+                "worst_median_ms": medians[worst_i],
                 "delta_ms": gap,
                 "delta_pct": pct,
             }
@@ -83,18 +122,30 @@ def summarize_variants(rows_by_variant: Dict[Tuple[str, str], List[Dict]]) -> Li
     return summary
 
 
-def summarize_pass_orders(rows_by_pass: Dict[str, List[Dict]]) -> List[Dict]:
+def summarize_pass_orders(cols: ResultColumns) -> List[Dict]:
+    # One scan with [total, count, min, max] accumulators per pass order.
+    stats: Dict[str, List[float]] = {}
+    for order, median in zip(cols.pass_order, cols.median_ms):
+        entry = stats.get(order)
+        if entry is None:
+            stats[order] = [median, 1, median, median]
+        else:
+            entry[0] += median
+            entry[1] += 1
+            if median < entry[2]:
+                entry[2] = median
+            elif median > entry[3]:
+                entry[3] = median
+
     summary = []
-    for order, entries in sorted(rows_by_pass.items()):
-        medians = [row["median_ms"] for row in entries]
-        avg = sum(medians) / len(medians)
+    for order, (total, count, low, high) in sorted(stats.items()):
         summary.append(
             {
                 "pass_order": order,
-                "num_samples": len(entries),
-                "mean_median_ms": avg,
-                "min_median_ms": min(medians),
-                "max_median_ms": max(medians),
+                "num_samples": int(count),
+                "mean_median_ms": total / count,
+                "min_median_ms": low,
+                "max_median_ms": high,
             }
         )
     return summary
@@ -107,12 +158,30 @@ def write_summary(summary_path: Path, *, config: Path, variant_stats: List[Dict]
         "variant_stats": variant_stats,
         "pass_order_stats": pass_stats,
     }
-    summary_path.parent.mkdir(parents=True, exist_ok=True)
-    with summary_path.open("w", encoding="utf-8") as fh:
-        json.dump(summary, fh, indent=2)
+    if orjson is not None:
+        summary_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        with summary_path.open("w", encoding="utf-8") as fh:
+            json.dump(summary, fh, indent=2)
     print(f"[collect] wrote summary to {summary_path}")
 
 
+def write_top_delta(summary_path: Path, variant_stats: List[Dict]) -> None:
+    """Write the highest-delta variant row to a sidecar next to the summary.
+
+    Downstream tooling (scripts/repeat_collection.py) only needs this one row
+    per run; emitting it here saves those consumers a full re-parse of the
+    summary.
+    """
+    top_path = summary_path.with_suffix(".top.json")
+    top_entry = max(variant_stats, key=lambda row: row["delta_pct"])
+    if orjson is not None:
+        top_path.write_bytes(orjson.dumps(top_entry, option=orjson.OPT_INDENT_2))
+    else:
+        with top_path.open("w", encoding="utf-8") as fh:
+            json.dump(top_entry, fh, indent=2)
+
+
 def print_human_summary(variant_stats: Iterable[Dict], pass_stats: Iterable[Dict], top_n: int = 10) -> None:
     print("\n=== Top variant deltas (best vs worst pass order) ===")
     ranked = sorted(variant_stats, key=lambda s: s["delta_pct"], reverse=True)
@@ -169,6 +238,9 @@ def main(argv: List[str]) -> int:
     make_script = root / "make"
     autotune_script = root / "autotuning" / "run_autotune.py"
 
+    summary_path = root / args.summary
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+
     if not args.skip_build:
         run_command(["./make"], cwd=root)
     if not args.skip_tests:
@@ -188,10 +260,11 @@ def main(argv: List[str]) -> int:
             cwd=root,
         )
 
-    rows_by_variant, rows_by_pass = parse_results(root / args.results)
-    variant_stats = summarize_variants(rows_by_variant)
-    pass_stats = summarize_pass_orders(rows_by_pass)
-    write_summary(root / args.summary, config=args.config, variant_stats=variant_stats, pass_stats=pass_stats)
+    cols = parse_results(root / args.results)
+    variant_stats = summarize_variants(cols)
+    pass_stats = summarize_pass_orders(cols)
+    write_summary(summary_path, config=args.config, variant_stats=variant_stats, pass_stats=pass_stats)
+    write_top_delta(summary_path, variant_stats)
     print_human_summary(variant_stats, pass_stats)
     return 0
 
@@ -6,11 +6,21 @@ identify the dominant pass ordering per benchmark based on aggregated data.
 
 from __future__ import annotations
 
+import csv
 import json
 from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional accelerator only
+    orjson = None
+
+
+def loads_json(data: bytes) -> Dict:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 
 FEATURES: Dict[str, Dict[str, str]] = {
     "rt01-fib-recursive": {"loops": "0", "tail": "No (non-tail recursion)", "branch": "High (if)"},
@@ -31,48 +41,52 @@ def load_summaries(run_dirs: List[Path]) -> List[Dict]:
     for run_dir in run_dirs:
         summary_path = run_dir / "summary.json"
         if summary_path.exists():
-            summaries.append(json.load(summary_path.open()))
+            summaries.append(loads_json(summary_path.read_bytes()))
     if not summaries:
         raise SystemExit("No summary files found for benchmark feature table.")
     return summaries
 
 
 def best_order_per_variant(summaries: List[Dict]) -> Dict[Tuple[str, str], str]:
-    # For each (benchmark, variant) gather rows from each summary
-    by_pair: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+    # Single pass over all rows: per (benchmark, variant) keep the vote
+    # counts, the summed worst medians, and per order the best-worst
+    # adjustment. The old tie-breaker averaged best_median_ms where the row
+    # voted for the candidate and worst_median_ms elsewhere; that average is
+    # (worst_total + adjustment[order]) / n, so no per-candidate rescan of
+    # the rows is needed.
+    votes: Dict[Tuple[str, str], Counter] = defaultdict(Counter)
+    worst_totals: Dict[Tuple[str, str], float] = defaultdict(float)
+    adjustments: Dict[Tuple[str, str], Dict[str, float]] = defaultdict(dict)
     for summary in summaries:
         for row in summary["variant_stats"]:
             key = (row["benchmark"], row["variant"])
-            by_pair[key].append(row)
+            order = row["best_order"]
+            votes[key][order] += 1
+            worst_totals[key] += row["worst_median_ms"]
+            per_order = adjustments[key]
+            per_order[order] = (
+                per_order.get(order, 0.0)
+                + row["best_median_ms"]
+                - row["worst_median_ms"]
+            )
 
     majority_order: Dict[Tuple[str, str], str] = {}
-    for key, rows in by_pair.items():
-        votes = Counter(row["best_order"] for row in rows)
-        majority = max(votes.values())
-        candidates = [order for order, count in votes.items() if count == majority]
+    for key, counts in votes.items():
+        majority = max(counts.values())
+        candidates = [order for order, count in counts.items() if count == majority]
         if len(candidates) == 1:
             majority_order[key] = candidates[0]
             continue
-        # Tie-breaker: lowest average best_median_ms (fallback to worst median if needed)
-        best_order = None
-        best_value = None
-        for order in candidates:
-            medians = []
-            for row in rows:
-                if row["best_order"] == order:
-                    medians.append(row["best_median_ms"])
-                else:
-                    medians.append(row["worst_median_ms"])
-            avg = sum(medians) / len(medians)
-            if best_value is None or avg < best_value:
-                best_value = avg
-                best_order = order
-        majority_order[key] = best_order
+        worst_total = worst_totals[key]
+        per_order = adjustments[key]
+        majority_order[key] = min(
+            candidates, key=lambda order: worst_total + per_order.get(order, 0.0)
+        )
     return majority_order
 
 
 def load_avg_deltas(aggregated_path: Path) -> Dict[Tuple[str, str], float]:
-    data = json.load(aggregated_path.open())
+    data = loads_json(aggregated_path.read_bytes())
     deltas = {}
     for bench, variant, delta in data["top_variant_stats"]:
         deltas[(bench, variant)] = delta
@@ -109,12 +123,13 @@ def build_table(
 
 def write_csv(rows: List[Dict[str, str]], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w") as fh:
-        fh.write("benchmark,loops,tail_recursion,branching,dominant_order\n")
-        for row in rows:
-            fh.write(
-                f"{row['benchmark']},{row['loops']},{row['tail']},{row['branch']},{row['dominant_order']}\n"
-            )
+    with path.open("w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["benchmark", "loops", "tail_recursion", "branching", "dominant_order"])
+        writer.writerows(
+            (row["benchmark"], row["loops"], row["tail"], row["branch"], row["dominant_order"])
+            for row in rows
+        )
 
 
 def write_latex(rows: List[Dict[str, str]], path: Path) -> None:
@@ -7,34 +7,365 @@ run's outputs in its own directory (results, summary, logs, intermediates).
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
+import mmap
+import os
+import shlex
 import subprocess
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json always works
+    orjson = None
+
+TEE_CHUNK = 65536
+
+# Reusable pipe-read buffer: sized generously, grown for fast producers, and
+# shrunk back to the soft cap after each run so memory stays bounded.
+BUF_SOFT_CAP = 131072
+BUF_HARD_CAP = 1 << 20
+_io_buf = bytearray(BUF_SOFT_CAP)
+
+
+class BufferedConsole:
+    """Batch console output: flush every 64 KiB or 100 ms, not per write.
+
+    print()/per-chunk flushing costs a lock acquire and a syscall each time;
+    batching keeps the console responsive while collapsing syscalls.
+    """
+
+    def __init__(self, raw) -> None:
+        self.raw = raw
+        self.pending = 0
+        self.last_flush = time.monotonic()
+
+    def write(self, data: bytes) -> None:
+        self.raw.write(data)
+        self.pending += len(data)
+        now = time.monotonic()
+        if self.pending >= TEE_CHUNK or now - self.last_flush >= 0.1:
+            self.flush(now)
+
+    def flush(self, now: Optional[float] = None) -> None:
+        self.raw.flush()
+        self.pending = 0
+        self.last_flush = now if now is not None else time.monotonic()
+
+
+def tee_pipe_portable(pipe, log, stdout) -> None:
+    # Bulk-read the pipe into one reused buffer: no bytes object is allocated
+    # per chunk, and Python-level work scales with volume, not line count.
+    global _io_buf
+    while True:
+        read = pipe.readinto1(_io_buf)
+        if not read:
+            break
+        view = memoryview(_io_buf)[:read]
+        log.write(view)
+        stdout.write(view)
+        view.release()
+        if read == len(_io_buf) and len(_io_buf) < BUF_HARD_CAP:
+            # A full read means the child outruns us; double the buffer.
+            _io_buf = bytearray(len(_io_buf) * 2)
+    if len(_io_buf) > BUF_SOFT_CAP:
+        _io_buf = bytearray(BUF_SOFT_CAP)
+
+
+def tee_pipe_splice(pipe, log, stdout) -> bool:
+    """Tee the child's stdout with kernel-side zero-copy where possible.
+
+    tee(2) duplicates each batch of pipe data without consuming it, then
+    splice(2) moves the original bytes straight into the log file — only the
+    console copy passes through Python. Returns False (before consuming
+    anything) when the syscalls are unavailable or the log target rejects
+    splice, so the caller can fall back to the portable loop.
+    """
+    if not (hasattr(os, "splice") and hasattr(os, "tee")):
+        return False
+    src_fd = pipe.fileno()
+    log.flush()
+    log_fd = log.fileno()
+    mid_r, mid_w = os.pipe()
+    spliced_any = False
+    try:
+        while True:
+            try:
+                duplicated = os.tee(src_fd, mid_w, TEE_CHUNK, 0)
+            except OSError:
+                if spliced_any:
+                    raise
+                return False
+            if duplicated == 0:
+                return True
+            remaining = duplicated
+            while remaining:
+                try:
+                    remaining -= os.splice(src_fd, log_fd, remaining)
+                except OSError:
+                    if spliced_any:
+                        raise
+                    return False
+            spliced_any = True
+            pending = duplicated
+            while pending:
+                data = os.read(mid_r, pending)
+                if not data:
+                    break
+                stdout.write(data)
+                pending -= len(data)
+    finally:
+        os.close(mid_r)
+        os.close(mid_w)
+
+
+# Logs are written strictly sequentially and never re-read here; telling the
+# kernel so enables larger writeback batches, and dropping the pages on close
+# keeps big batch-run logs from crowding the page cache. No-ops off Linux.
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+
+def advise_log_open(fd: int) -> None:
+    if _HAS_FADVISE:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def advise_log_close(fd: int) -> None:
+    if _HAS_FADVISE:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
 
 
 def run_command(cmd: List[str], *, cwd: Path, log_file: Path) -> None:
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-    with log_file.open("w", encoding="utf-8") as log:
-        log.write(f"$ {' '.join(cmd)}\n\n")
+    # Open the log as a raw fd wrapped in a BufferedWriter: child output is
+    # already bytes, so nothing is ever encoded or decoded on the way to disk,
+    # and the buffer amortizes write(2) calls.
+    log_fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    advise_log_open(log_fd)
+    with os.fdopen(log_fd, "wb", buffering=1 << 20) as log:
+        # close_fds=False skips the fork-time fd-table scan and lets CPython
+        # take its posix_spawn fast path; this wrapper holds no sensitive fds.
         process = subprocess.Popen(
             cmd,
             cwd=cwd,
-            text=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
+            close_fds=False,
+        )
+        # Format the header while the child is already starting up; shlex.join
+        # quotes arguments with spaces so the logged line is replayable.
+        log.write(f"$ {shlex.join(cmd)}\n\n".encode("utf-8"))
+        stdout = BufferedConsole(sys.stdout.buffer)
+        if not tee_pipe_splice(process.stdout, log, stdout):
+            tee_pipe_portable(process.stdout, log, stdout)
+        stdout.flush()
+        process.stdout.close()
+        # Pipe EOF almost always means the child already exited, so a
+        # non-blocking poll() reaps it without the extra wait() round-trip;
+        # wait() remains the fallback for a child that closed stdout early.
+        ret = process.poll()
+        if ret is None:
+            ret = process.wait()
+        log.write(f"\n[exit {ret}]\n".encode("utf-8"))
+        log.flush()
+        advise_log_close(log_fd)
+        if ret != 0:
+            raise SystemExit(f"Command failed (see {log_file})")
+
+
+async def run_command_async(cmd: List[str], *, cwd: Path, log_file: Path) -> None:
+    """Async counterpart of run_command for overlapping concurrent runs.
+
+    asyncio StreamReaders cannot be spliced, so this path copies through
+    Python; what it buys is that the event loop drains N child pipes in one
+    process, with no worker processes or argument pickling.
+    """
+    log_fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    advise_log_open(log_fd)
+    with os.fdopen(log_fd, "wb", buffering=1 << 20) as log:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
         )
-        for line in process.stdout:
-            log.write(line)
-            print(line, end="")
-        ret = process.wait()
-        log.write(f"\n[exit {ret}]\n")
+        log.write(f"$ {shlex.join(cmd)}\n\n".encode("utf-8"))
+        stdout = BufferedConsole(sys.stdout.buffer)
+        while True:
+            data = await process.stdout.read(TEE_CHUNK)
+            if not data:
+                break
+            log.write(data)
+            stdout.write(data)
+        stdout.flush()
+        ret = await process.wait()
+        log.write(f"\n[exit {ret}]\n".encode("utf-8"))
+        log.flush()
+        advise_log_close(log_fd)
         if ret != 0:
             raise SystemExit(f"Command failed (see {log_file})")
 
 
+def top_delta_entry(summary_path: Path) -> Dict:
+    """Find the variant_stats row with the largest delta_pct incrementally.
+
+    The summary is memory-mapped and decoded one row at a time through a
+    sliding window with json.JSONDecoder.raw_decode: no read-buffer copy of
+    the file, and only the current row plus the running best are ever
+    materialized, however many variants a run produced.
+    """
+    decoder = json.JSONDecoder()
+    best: Optional[Dict] = None
+    window = 1 << 16
+    with open(summary_path, "rb") as fh, \
+            mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = mm.size()
+        marker = mm.find(b'"variant_stats"')
+        if marker == -1:
+            raise SystemExit(f"No variant_stats in {summary_path}")
+        pos = mm.find(b"[", marker)
+        if pos == -1:
+            raise SystemExit(f"No variant_stats in {summary_path}")
+        pos += 1
+        while True:
+            while pos < size and mm[pos] in b", \t\r\n":
+                pos += 1
+            if pos >= size or mm[pos] == ord("]"):
+                break
+            span = window
+            while True:
+                try:
+                    chunk = mm[pos:min(pos + span, size)].decode("utf-8")
+                    row, end = decoder.raw_decode(chunk)
+                    break
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    # Row (or a multi-byte char) crosses the window boundary.
+                    if pos + span >= size:
+                        raise
+                    span *= 2
+            pos += len(chunk[:end].encode("utf-8"))
+            if best is None or row.get("delta_pct", 0.0) > best.get("delta_pct", 0.0):
+                best = row
+    if best is None:
+        raise SystemExit(f"Empty variant_stats in {summary_path}")
+    return best
+
+
+def build_run(
+    idx: int,
+    cmd_prefix: Tuple[str, ...],
+    results_root: Path,
+    skip_tests: bool,
+    skip_build: bool,
+    extra_args: Optional[List[str]],
+) -> Tuple[List[str], Path, Path, Path]:
+    """Assemble one run's command line and artifact paths."""
+    run_dir = results_root / f"run{idx}"
+    summary_path = run_dir / "summary.json"
+    results_path = run_dir / "results.csv"
+    out_dir = run_dir / "out"
+    log_file = run_dir / "collect.log"
+
+    cmd = [
+        *cmd_prefix,
+        "--results",
+        str(results_path),
+        "--summary",
+        str(summary_path),
+        "--autotune-out-dir",
+        str(out_dir),
+    ]
+    if skip_tests:
+        cmd.append("--skip-tests")
+    if skip_build:
+        cmd.append("--skip-build")
+    if extra_args:
+        cmd.extend(extra_args)
+    return cmd, summary_path, results_path, log_file
+
+
+def digest_run(idx: int, root: Path, summary_path: Path, results_path: Path, log_file: Path) -> Dict:
+    """Build one manifest entry from a finished run's artifacts."""
+    # collect_data.py drops the top row in a sidecar; read that when present
+    # and only stream-scan the full summary for older runs without one.
+    top_path = summary_path.with_suffix(".top.json")
+    if top_path.exists():
+        raw = top_path.read_bytes()
+        top_entry = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    else:
+        top_entry = top_delta_entry(summary_path)
+    # Plain string prefix-stripping beats three PurePath.relative_to walks.
+    root_prefix = str(root) + os.sep
+    return {
+        "run": idx,
+        "summary": str(summary_path).removeprefix(root_prefix),
+        "results": str(results_path).removeprefix(root_prefix),
+        "log": str(log_file).removeprefix(root_prefix),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "top_delta": {
+            "benchmark": top_entry["benchmark"],
+            "variant": top_entry["variant"],
+            "delta_pct": top_entry["delta_pct"],
+            "best_order": top_entry["best_order"],
+            "worst_order": top_entry["worst_order"],
+        },
+    }
+
+
+def do_run(
+    idx: int,
+    total: int,
+    root: Path,
+    cmd_prefix: Tuple[str, ...],
+    results_root: Path,
+    skip_tests: bool,
+    skip_build: bool,
+    extra_args: Optional[List[str]],
+) -> Dict:
+    """Execute one collect_data run in its own directory and digest its summary."""
+    cmd, summary_path, results_path, log_file = build_run(
+        idx, cmd_prefix, results_root, skip_tests, skip_build, extra_args
+    )
+    print(f"\n=== Run {idx}/{total} ===")
+    run_command(cmd, cwd=root, log_file=log_file)
+    return digest_run(idx, root, summary_path, results_path, log_file)
+
+
+async def do_run_async(
+    idx: int,
+    total: int,
+    root: Path,
+    cmd_prefix: Tuple[str, ...],
+    results_root: Path,
+    skip_tests: bool,
+    skip_build: bool,
+    extra_args: Optional[List[str]],
+) -> Dict:
+    """do_run over run_command_async, for overlapping independent runs."""
+    cmd, summary_path, results_path, log_file = build_run(
+        idx, cmd_prefix, results_root, skip_tests, skip_build, extra_args
+    )
+    print(f"\n=== Run {idx}/{total} ===")
+    await run_command_async(cmd, cwd=root, log_file=log_file)
+    return digest_run(idx, root, summary_path, results_path, log_file)
+
+
+def append_manifest_entry(fh, entry: Dict) -> None:
+    # Compact JSON, one line per run: skips the indented encoder's slow path
+    # and gives tools a manifest they can consume while the batch is running.
+    if orjson is not None:
+        fh.write(orjson.dumps(entry) + b"\n")
+    else:
+        fh.write(json.dumps(entry, separators=(",", ":")).encode("utf-8") + b"\n")
+    # Persist the line now: a batch killed after run K still has K entries on
+    # disk. One flush+fsync per multi-second run is noise next to the run.
+    fh.flush()
+    os.fsync(fh.fileno())
+
+
 def main(argv: List[str]) -> int:
     parser = argparse.ArgumentParser(description="Repeat collect_data runs with isolated artifacts")
     parser.add_argument("--runs", type=int, default=3, help="How many times to run the pipeline (default: 3)")
@@ -67,6 +398,14 @@ def main(argv: List[str]) -> int:
         action="store_true",
         help="Skip ./make after the first run to save time",
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Worker processes for runs 2..N; takes effect only when both "
+        "--skip-build-after-first and --skip-tests-after-first make later "
+        "runs independent (default: 1)",
+    )
     parser.add_argument(
         "--extra-collector-args",
         nargs=argparse.REMAINDER,
@@ -81,67 +420,95 @@ def main(argv: List[str]) -> int:
 
     results_root = (root / args.results_root).resolve()
     results_root.mkdir(parents=True, exist_ok=True)
-
-    metadata = []
+    # One metadata pass up front: every run directory exists before any child
+    # is spawned, so no mkdir round trips interleave with the runs themselves.
     for idx in range(1, args.runs + 1):
-        run_dir = results_root / f"run{idx}"
-        run_dir.mkdir(parents=True, exist_ok=True)
-        summary_path = run_dir / "summary.json"
-        results_path = run_dir / "results.csv"
-        out_dir = run_dir / "out"
-        log_file = run_dir / "collect.log"
-
-        cmd = [
-            sys.executable,
-            str(collector),
-            "--project-root",
-            str(root),
-            "--config",
-            str(args.config),
-            "--results",
-            str(results_path),
-            "--summary",
-            str(summary_path),
-            "--autotune-out-dir",
-            str(out_dir),
+        (results_root / f"run{idx}").mkdir(exist_ok=True)
+
+    # These five arguments are identical for every run; stringify the paths
+    # once here instead of once per run in build_run.
+    cmd_prefix = (
+        sys.executable,
+        str(collector),
+        "--project-root",
+        str(root),
+        "--config",
+        str(args.config),
+    )
+
+    ndjson_path = results_root / "manifest.ndjson"
+    with open(ndjson_path, "wb") as ndjson:
+        metadata = [
+            do_run(
+                1,
+                args.runs,
+                root,
+                cmd_prefix,
+                results_root,
+                skip_tests=False,
+                skip_build=False,
+                extra_args=args.extra_collector_args,
+            )
         ]
+        append_manifest_entry(ndjson, metadata[0])
 
-        if args.skip_tests_after_first and idx > 1:
-            cmd.append("--skip-tests")
-        if args.skip_build_after_first and idx > 1:
-            cmd.append("--skip-build")
-        if args.extra_collector_args:
-            cmd.extend(args.extra_collector_args)
-
-        print(f"\n=== Run {idx}/{args.runs} ===")
-        run_command(cmd, cwd=root, log_file=log_file)
-
-        # Parse summary for a quick digest
-        summary_data = json.load(summary_path.open())
-        top_entry = max(
-            summary_data["variant_stats"],
-            key=lambda row: row.get("delta_pct", 0.0),
-        )
-        metadata.append(
-            {
-                "run": idx,
-                "summary": str(summary_path.relative_to(root)),
-                "results": str(results_path.relative_to(root)),
-                "log": str(log_file.relative_to(root)),
-                "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
-                "top_delta": {
-                    "benchmark": top_entry["benchmark"],
-                    "variant": top_entry["variant"],
-                    "delta_pct": top_entry["delta_pct"],
-                    "best_order": top_entry["best_order"],
-                    "worst_order": top_entry["worst_order"],
-                },
-            }
+        later_runs = range(2, args.runs + 1)
+        parallel = max(1, args.parallel)
+        # Runs 2..N are only independent when they neither rebuild nor re-test;
+        # otherwise they would race on the shared build tree.
+        can_overlap = (
+            parallel > 1
+            and args.skip_build_after_first
+            and args.skip_tests_after_first
         )
+        if can_overlap and args.runs > 1:
+            # One event loop drains every child's pipe while the collectors
+            # run; the semaphore caps how many children are alive at once.
+            async def overlap_runs() -> List[Dict]:
+                limiter = asyncio.Semaphore(parallel)
+
+                async def bounded(idx: int) -> Dict:
+                    async with limiter:
+                        entry = await do_run_async(
+                            idx,
+                            args.runs,
+                            root,
+                            cmd_prefix,
+                            results_root,
+                            skip_tests=True,
+                            skip_build=True,
+                            extra_args=args.extra_collector_args,
+                        )
+                    # The loop is single-threaded, so appends never interleave
+                    # mid-line; lines land in completion order.
+                    append_manifest_entry(ndjson, entry)
+                    return entry
+
+                return await asyncio.gather(*(bounded(idx) for idx in later_runs))
+
+            metadata.extend(asyncio.run(overlap_runs()))
+        else:
+            for idx in later_runs:
+                entry = do_run(
+                    idx,
+                    args.runs,
+                    root,
+                    cmd_prefix,
+                    results_root,
+                    skip_tests=args.skip_tests_after_first,
+                    skip_build=args.skip_build_after_first,
+                    extra_args=args.extra_collector_args,
+                )
+                append_manifest_entry(ndjson, entry)
+                metadata.append(entry)
 
     manifest_path = results_root / "manifest.json"
-    with manifest_path.open("w", encoding="utf-8") as fh:
-        json.dump({"runs": metadata}, fh, indent=2)
+    manifest = {"runs": metadata}
+    if orjson is not None:
+        manifest_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    else:
+        with manifest_path.open("w", encoding="utf-8") as fh:
+            json.dump(manifest, fh, indent=2)
     print(f"\nWrote manifest to {manifest_path}")
     return 0
 